@@ -0,0 +1,229 @@
+"""Admission control for write routes.
+
+Write requests take a token from a per-IP and a per-user bucket, then one
+of a bounded number of write slots. Requests over their rate get a 429,
+requests arriving while every slot is busy get a 503; both carry a
+Retry-After header. Priority routes (admin and payment operations) may use
+slots that ordinary writes leave in reserve.
+
+Counters live in a small SQLite file next to the main database so every
+gunicorn worker sees the same buckets, slots and metrics.
+"""
+import math
+import os
+import random
+import sqlite3
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, request
+from flask_login import current_user
+from werkzeug.exceptions import ServiceUnavailable, TooManyRequests
+
+METRICS = ('admitted', 'shed_rate_limited', 'shed_overloaded')
+
+
+def _refill(tokens, updated_at, now, rate, burst):
+    return min(burst, tokens + (now - updated_at) * rate)
+
+
+def _take_all(buckets, current, now):
+    """Take one token from every bucket, or from none of them.
+
+    `buckets` is [(key, rate, burst)] and `current` maps keys to their stored
+    (tokens, updated_at). Returns the new {key: tokens} and the seconds to
+    wait before retrying, 0 when the request is admitted.
+    """
+    tokens = {
+        key: _refill(*current[key], now, rate, burst) if key in current else burst
+        for key, rate, burst in buckets
+    }
+    wait = max(((1 - tokens[key]) / rate for key, rate, _ in buckets if tokens[key] < 1), default=0)
+    if not wait:
+        tokens = {key: value - 1 for key, value in tokens.items()}
+    return tokens, wait
+
+
+class MemoryStore:
+    """Per-process counters; only suitable for a single worker or tests."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._slots = {}
+        self._next_slot = 0
+        self._metrics = dict.fromkeys(METRICS, 0)
+
+    def take(self, buckets, now):
+        with self._lock:
+            tokens, wait = _take_all(buckets, self._buckets, now)
+            self._buckets.update((key, (value, now)) for key, value in tokens.items())
+            return wait
+
+    def acquire_slot(self, limit, timeout, now):
+        with self._lock:
+            self._slots = {k: t for k, t in self._slots.items() if t >= now - timeout}
+            if len(self._slots) >= limit:
+                return None
+            self._next_slot += 1
+            self._slots[self._next_slot] = now
+            return self._next_slot
+
+    def release_slot(self, slot):
+        with self._lock:
+            self._slots.pop(slot, None)
+
+    def incr(self, metric):
+        with self._lock:
+            self._metrics[metric] += 1
+
+    def metrics(self):
+        with self._lock:
+            return dict(self._metrics, in_flight=len(self._slots))
+
+
+class SQLiteStore:
+    """Counters shared between processes through a SQLite file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS bucket (key TEXT PRIMARY KEY, tokens REAL, updated_at REAL);
+            CREATE TABLE IF NOT EXISTS slot (id INTEGER PRIMARY KEY AUTOINCREMENT, acquired_at REAL);
+            CREATE TABLE IF NOT EXISTS metric (name TEXT PRIMARY KEY, value INTEGER NOT NULL DEFAULT 0);
+        ''')
+        conn.executemany('INSERT OR IGNORE INTO metric (name) VALUES (?)', [(m,) for m in METRICS])
+
+    def _conn(self):
+        # One connection per thread, opened lazily so forked workers get their own
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA synchronous=OFF')
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def take(self, buckets, now):
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            keys = [key for key, _, _ in buckets]
+            current = {
+                key: (tokens, updated_at) for key, tokens, updated_at in conn.execute(
+                    'SELECT key, tokens, updated_at FROM bucket WHERE key IN (%s)' % ', '.join('?' * len(keys)),
+                    keys,
+                )
+            }
+            tokens, wait = _take_all(buckets, current, now)
+            conn.executemany('INSERT OR REPLACE INTO bucket VALUES (?, ?, ?)',
+                             [(key, value, now) for key, value in tokens.items()])
+            # Buckets idle long enough to be full again carry no information
+            if random.random() < 0.01:
+                conn.execute('DELETE FROM bucket WHERE updated_at < ?',
+                             (now - max(burst / rate for _, rate, burst in buckets),))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return wait
+
+    def acquire_slot(self, limit, timeout, now):
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Slots left behind by a crashed worker expire after `timeout`
+            conn.execute('DELETE FROM slot WHERE acquired_at < ?', (now - timeout,))
+            (in_use,) = conn.execute('SELECT COUNT(*) FROM slot').fetchone()
+            slot = None
+            if in_use < limit:
+                slot = conn.execute('INSERT INTO slot (acquired_at) VALUES (?)', (now,)).lastrowid
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return slot
+
+    def release_slot(self, slot):
+        self._conn().execute('DELETE FROM slot WHERE id = ?', (slot,))
+
+    def incr(self, metric):
+        self._conn().execute('UPDATE metric SET value = value + 1 WHERE name = ?', (metric,))
+
+    def metrics(self):
+        conn = self._conn()
+        result = dict(conn.execute('SELECT name, value FROM metric'))
+        (result['in_flight'],) = conn.execute('SELECT COUNT(*) FROM slot').fetchone()
+        return result
+
+
+class AdmissionControl:
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        path = app.config['ADMISSION_STORE_PATH']
+        if path == ':memory:':
+            store = MemoryStore()
+        else:
+            if path is None:
+                os.makedirs(app.instance_path, exist_ok=True)
+                path = os.path.join(app.instance_path, 'admission.db')
+            store = SQLiteStore(path)
+        app.extensions['admission'] = store
+
+    @property
+    def store(self):
+        return current_app.extensions['admission']
+
+    def metrics(self):
+        return self.store.metrics()
+
+    def limit(self, priority=False):
+        """Guard the POST branch of a write route.
+
+        Priority routes can use the reserved slots that ordinary writes
+        cannot, so payments and admin actions still get through under load.
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapped(*args, **kwargs):
+                config = current_app.config
+                if request.method != 'POST' or not config['ADMISSION_ENABLED']:
+                    return view(*args, **kwargs)
+
+                store = self.store
+                now = time.time()
+                buckets = [('ip:%s' % request.remote_addr, *config['ADMISSION_IP_RATE'])]
+                if current_user.is_authenticated:
+                    buckets.append(('user:%s' % current_user.id, *config['ADMISSION_USER_RATE']))
+                # All or nothing, so a user over their rate doesn't also drain the IP bucket
+                wait = store.take(buckets, now)
+                if wait:
+                    store.incr('shed_rate_limited')
+                    raise TooManyRequests(retry_after=math.ceil(wait))
+
+                limit = config['ADMISSION_WRITE_CONCURRENCY']
+                if not priority:
+                    limit -= config['ADMISSION_PRIORITY_RESERVED']
+                slot = store.acquire_slot(limit, config['ADMISSION_SLOT_TIMEOUT'], now)
+                if slot is None:
+                    store.incr('shed_overloaded')
+                    raise ServiceUnavailable(retry_after=config['ADMISSION_RETRY_AFTER'])
+
+                store.incr('admitted')
+                try:
+                    return view(*args, **kwargs)
+                finally:
+                    try:
+                        store.release_slot(slot)
+                    except sqlite3.OperationalError:
+                        # The slot times out on its own; don't turn a served request into a 500
+                        current_app.logger.warning('Could not release admission slot %s', slot, exc_info=True)
+            return wrapped
+        return decorator
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import and_, delete, exists, insert, literal, or_, select
+
+from enums import BookingStatus, PaymentStatus
+from extensions import db
+from models import Booking, BookingHistory, Event
+
+SETTLED_STATUSES = (BookingStatus.COMPLETED, BookingStatus.CANCELLED)
+
+# Client paid, provider not yet: pay_provider only updates booking, so these
+# rows stay in the hot table whatever their status or age
+AWAITING_PAYOUT = and_(
+    Booking.payment_status == PaymentStatus.PAID,
+    or_(Booking.provider_payment_status.is_(None), Booking.provider_payment_status != PaymentStatus.PAID),
+)
+
+# Columns copied verbatim from booking to booking_history
+ARCHIVED_COLUMNS = (
+    'id', 'event_id', 'provider_id', 'status', 'payment_status', 'payment_amount',
+    'provider_payment', 'provider_payment_status', 'platform_fee_percentage', 'created_at',
+)
+
+
+def ensure_archive_schema():
+    """Create booking_history and the hot-table indexes if they are missing."""
+    BookingHistory.__table__.create(db.engine, checkfirst=True)
+    for index in Booking.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+
+
+def move_to_history(booking_ids):
+    """Copy the given bookings into booking_history and delete them from booking.
+
+    Runs inside the caller's transaction; the caller commits.
+    """
+    if not booking_ids:
+        return 0
+    booking = Booking.__table__
+    rows = (
+        select(*(booking.c[name] for name in ARCHIVED_COLUMNS),
+               Event.title,
+               literal(datetime.utcnow(), db.DateTime))
+        .select_from(booking.outerjoin(Event.__table__, Event.id == booking.c.event_id))
+        .where(booking.c.id.in_(booking_ids))
+    )
+    db.session.execute(
+        insert(BookingHistory.__table__).from_select(
+            list(ARCHIVED_COLUMNS) + ['event_title', 'archived_at'], rows
+        )
+    )
+    db.session.execute(delete(booking).where(booking.c.id.in_(booking_ids)))
+    return len(booking_ids)
+
+
+def archive_bookings(older_than_days=None, batch_size=None):
+    """Move settled bookings older than the cutoff out of the hot table.
+
+    Bookings whose event no longer exists are archived regardless of age.
+    Bookings still awaiting a provider payout are never moved.
+    Each batch is committed separately so the SQLite write lock is never
+    held for long. Returns the number of bookings moved.
+    """
+    if older_than_days is None:
+        older_than_days = current_app.config['ARCHIVE_AFTER_DAYS']
+    if batch_size is None:
+        batch_size = current_app.config['ARCHIVE_BATCH_SIZE']
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+
+    # Two separate sweeps: OR-ing them together stops SQLite from using
+    # ix_booking_status_created and turns every batch into a full scan
+    settled = and_(Booking.status.in_(SETTLED_STATUSES), Booking.created_at < cutoff, ~AWAITING_PAYOUT)
+    orphaned = and_(or_(Booking.event_id.is_(None), ~exists().where(Event.id == Booking.event_id)),
+                    ~AWAITING_PAYOUT)
+    return _archive_in_batches(settled, batch_size) + _archive_in_batches(orphaned, batch_size)
+
+
+def _archive_in_batches(criteria, batch_size):
+    moved = 0
+    while True:
+        ids = db.session.scalars(select(Booking.id).where(criteria).limit(batch_size)).all()
+        if not ids:
+            break
+        moved += move_to_history(ids)
+        db.session.commit()
+    return moved
+
+
+@click.command('archive-bookings')
+@click.option('--days', type=int, default=None, help='Archive settled bookings older than this many days.')
+@click.option('--batch-size', type=int, default=None, help='Bookings moved per transaction.')
+@with_appcontext
+def archive_command(days, batch_size):
+    """Move completed and cancelled bookings into booking_history."""
+    ensure_archive_schema()
+    moved = archive_bookings(days, batch_size)
+    click.echo(f'Archived {moved} bookings')
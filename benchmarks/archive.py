@@ -0,0 +1,87 @@
+"""Hot-path latency as settled booking history grows.
+
+For each history size the same live workload (pending/confirmed bookings)
+is queried twice: once with all history left in ``booking`` and once after
+the archival job has moved it to ``booking_history``.
+
+    python benchmarks/archive.py [history sizes...]
+"""
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+from app import create_app  # noqa: E402
+from archive import archive_bookings, ensure_archive_schema  # noqa: E402
+from extensions import db  # noqa: E402
+from models import Booking, Event, User  # noqa: E402
+
+PROVIDERS = 50
+LIVE_BOOKINGS = 2000
+QUERY_RUNS = 200
+
+
+def populate(history_rows):
+    db.session.execute(insert(User.__table__), [
+        {'id': i, 'email': f'p{i}@example.com', 'role': 'provider'} for i in range(1, PROVIDERS + 1)
+    ])
+    db.session.execute(insert(Event.__table__), [{'id': 1, 'title': 'Bench'}])
+    old = datetime.utcnow() - timedelta(days=400)
+    rows = [
+        {'event_id': 1, 'provider_id': random.randint(1, PROVIDERS),
+         'status': random.choice(('completed', 'cancelled')), 'payment_status': 'paid',
+         'payment_amount': 100.0, 'platform_fee_percentage': 20, 'created_at': old}
+        for _ in range(history_rows)
+    ] + [
+        {'event_id': 1, 'provider_id': random.randint(1, PROVIDERS),
+         'status': random.choice(('pending', 'confirmed')), 'payment_status': 'pending',
+         'payment_amount': None, 'platform_fee_percentage': 20, 'created_at': datetime.utcnow()}
+        for _ in range(LIVE_BOOKINGS)
+    ]
+    for start in range(0, len(rows), 50000):
+        db.session.execute(insert(Booking.__table__), rows[start:start + 50000])
+    db.session.commit()
+
+
+def time_hot_queries():
+    samples = []
+    for _ in range(QUERY_RUNS):
+        provider_id = random.randint(1, PROVIDERS)
+        start = time.perf_counter()
+        Booking.query.filter_by(provider_id=provider_id, status='pending').all()
+        Booking.query.filter_by(provider_id=provider_id, status='confirmed', payment_status='pending').all()
+        Booking.query.filter_by(status='pending').count()
+        samples.append(time.perf_counter() - start)
+        db.session.remove()
+    return statistics.median(samples) * 1000
+
+
+def main(sizes):
+    print('%12s %18s %18s' % ('history', 'single table (ms)', 'archived (ms)'))
+    for size in sizes:
+        workdir = tempfile.mkdtemp()
+        try:
+            app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{workdir}/bench.db',
+                              'JINJA_BYTECODE_CACHE_DIR': f'{workdir}/jinja_cache'})
+            with app.app_context():
+                db.create_all()
+                ensure_archive_schema()
+                populate(size)
+                single = time_hot_queries()
+                archive_bookings(older_than_days=180, batch_size=5000)
+                archived = time_hot_queries()
+            print('%12d %18.3f %18.3f' % (size, single, archived))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main([int(n) for n in sys.argv[1:]] or [10000, 100000, 1000000])
@@ -0,0 +1,66 @@
+"""Row-by-row versus set-based booking transitions.
+
+Confirms N pending bookings the way accept_booking does (load, set status,
+commit, once per booking) and with a single transition_bookings() call.
+
+    python benchmarks/bulk_transition.py [sizes...]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, insert  # noqa: E402
+
+from app import create_app  # noqa: E402
+from bookings import transition_bookings  # noqa: E402
+from extensions import db  # noqa: E402
+from models import Booking  # noqa: E402
+
+PROVIDER = SimpleNamespace(id=1, role='provider')
+
+
+def reset(size):
+    db.session.execute(delete(Booking))
+    db.session.execute(insert(Booking), [
+        {'id': i, 'event_id': 1, 'provider_id': PROVIDER.id, 'status': 'pending'} for i in range(1, size + 1)
+    ])
+    db.session.commit()
+
+
+def main(sizes):
+    print('%8s %16s %16s' % ('bookings', 'row-by-row (ms)', 'bulk (ms)'))
+    for size in sizes:
+        workdir = tempfile.mkdtemp()
+        try:
+            app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{workdir}/bench.db',
+                              'JINJA_BYTECODE_CACHE_DIR': f'{workdir}/jinja_cache',
+                              'ADMISSION_STORE_PATH': ':memory:'})
+            with app.app_context():
+                db.create_all()
+
+                reset(size)
+                start = time.perf_counter()
+                for booking_id in range(1, size + 1):
+                    booking = db.session.get(Booking, booking_id)
+                    if booking.provider_id == PROVIDER.id:
+                        booking.status = 'confirmed'
+                    db.session.commit()
+                row_by_row = time.perf_counter() - start
+
+                reset(size)
+                start = time.perf_counter()
+                transition_bookings(PROVIDER, range(1, size + 1), 'confirmed')
+                db.session.commit()
+                bulk = time.perf_counter() - start
+            print('%8d %16.2f %16.2f' % (size, row_by_row * 1000, bulk * 1000))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main([int(n) for n in sys.argv[1:]] or [10, 100, 500])
@@ -0,0 +1,73 @@
+"""Startup benchmark: import time, app creation and first-request latency.
+
+Each scenario runs in a fresh interpreter so module and template caches
+start cold, the way a freshly recycled gunicorn worker would.
+
+    python benchmarks/startup.py [runs]
+"""
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r'''
+import json, sys, time
+t0 = time.perf_counter()
+import app as app_module
+t1 = time.perf_counter()
+from extensions import db
+flask_app = app_module.create_app({
+    'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + sys.argv[1] + '/bench.db',
+    'JINJA_BYTECODE_CACHE_DIR': sys.argv[1] + '/jinja_cache',
+})
+with flask_app.app_context():
+    db.create_all()
+t2 = time.perf_counter()
+if sys.argv[2] == 'warm':
+    from warmup import warm_up
+    warm_up(flask_app)
+t3 = time.perf_counter()
+client = flask_app.test_client()
+for path in ('/', '/register', '/login'):
+    client.get(path)
+t4 = time.perf_counter()
+print(json.dumps({'import': t1 - t0, 'create_app': t2 - t1, 'warm_up': t3 - t2, 'first_requests': t4 - t3}))
+'''
+
+
+def run(workdir, mode):
+    out = subprocess.run([sys.executable, '-c', CHILD, workdir, mode],
+                         cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(runs=5):
+    scenarios = {
+        'no warm-up, empty bytecode cache': ('cold', True),
+        'no warm-up, primed bytecode cache': ('cold', False),
+        'warm-up, empty bytecode cache': ('warm', True),
+        'warm-up, primed bytecode cache': ('warm', False),
+    }
+    for label, (mode, clear_cache) in scenarios.items():
+        samples = []
+        workdir = tempfile.mkdtemp()
+        try:
+            run(workdir, 'warm')  # populate the bytecode cache once
+            for _ in range(runs):
+                if clear_cache:
+                    shutil.rmtree(os.path.join(workdir, 'jinja_cache'), ignore_errors=True)
+                samples.append(run(workdir, mode))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        print(label)
+        for key in ('import', 'create_app', 'warm_up', 'first_requests'):
+            print('  %-15s %8.2f ms' % (key, statistics.median(s[key] for s in samples) * 1000))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
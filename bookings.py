@@ -0,0 +1,94 @@
+from sqlalchemy import select, true, update
+
+from enums import BookingStatus, PaymentStatus, Role
+from extensions import db
+from models import Booking, Event
+
+# The only legal state changes. Per role, (field, target) maps to the values
+# the field may currently hold and any other conditions the row must meet.
+TRANSITIONS = {
+    Role.PROVIDER: {
+        ('status', BookingStatus.CONFIRMED): ((BookingStatus.PENDING,), ()),
+        ('status', BookingStatus.CANCELLED): ((BookingStatus.PENDING,), ()),
+        ('status', BookingStatus.COMPLETED): (
+            (BookingStatus.CONFIRMED,), (Booking.payment_status == PaymentStatus.PAID,)
+        ),
+        ('payment_status', PaymentStatus.PAID): (
+            (PaymentStatus.PENDING,), (Booking.status == BookingStatus.CONFIRMED,)
+        ),
+    },
+    Role.CLIENT: {
+        ('status', BookingStatus.CANCELLED): ((BookingStatus.PENDING, BookingStatus.CONFIRMED), ()),
+        ('status', BookingStatus.COMPLETED): (
+            (BookingStatus.CONFIRMED,), (Booking.payment_status == PaymentStatus.PAID,)
+        ),
+    },
+    Role.ADMIN: {
+        ('provider_payment_status', PaymentStatus.PAID): (
+            (PaymentStatus.PENDING,), (Booking.payment_status == PaymentStatus.PAID,)
+        ),
+    },
+}
+
+
+def allowed_targets(user, field='status'):
+    return {target for f, target in TRANSITIONS.get(user.role, {}) if f == field}
+
+
+def _owned_by(user):
+    if user.role == Role.ADMIN:
+        return true()
+    if user.role == Role.PROVIDER:
+        return Booking.provider_id == user.id
+    return Booking.event_id.in_(select(Event.id).where(Event.client_id == user.id))
+
+
+def _apply(user, field, target, values, *criteria):
+    """Run one UPDATE for every booking matching `criteria` that `user` may move to `target`.
+
+    Returns the ids that changed. The caller commits.
+    """
+    rules = TRANSITIONS.get(user.role, {}).get((field, target))
+    if rules is None:
+        return set()
+    sources, conditions = rules
+    column = getattr(Booking, field)
+    stmt = (
+        update(Booking)
+        .where(*criteria, _owned_by(user), column.in_(sources), *conditions)
+        .values({field: target, **(values or {})})
+        .returning(Booking.id)
+        .execution_options(synchronize_session=False)
+    )
+    return set(db.session.scalars(stmt))
+
+
+def transition_bookings(user, booking_ids, target, field='status', values=None):
+    """Move many bookings to `target` with a single set-based UPDATE.
+
+    `values` are extra columns set on the rows that move (they may be SQL
+    expressions). Returns {booking_id: 'ok' | 'invalid_transition' |
+    'not_found'}; bookings the user does not own are reported as not found.
+    """
+    ids = set(booking_ids)
+    updated = _apply(user, field, target, values, Booking.id.in_(ids))
+    results = dict.fromkeys(updated, 'ok')
+    remaining = ids - updated
+    if remaining:
+        # One more query to tell "exists but can't move" from "not yours/not there"
+        owned = set(db.session.scalars(
+            select(Booking.id).where(Booking.id.in_(remaining), _owned_by(user))
+        ))
+        for booking_id in remaining:
+            results[booking_id] = 'invalid_transition' if booking_id in owned else 'not_found'
+    return results
+
+
+def transition_booking(user, booking_id, target, field='status', values=None):
+    """Single-booking form of transition_bookings(); returns the result string."""
+    return transition_bookings(user, [booking_id], target, field, values)[booking_id]
+
+
+def transition_event_bookings(user, event_id, target):
+    """Move every booking of an event that allows it to `target`; returns the changed ids."""
+    return _apply(user, 'status', target, None, Booking.event_id == event_id)
@@ -0,0 +1,29 @@
+import os
+
+
+class Config:
+    SECRET_KEY = 'your_secret_key'
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///ezyevent.db'
+    UPLOAD_FOLDER = 'static/uploads'
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max-limit
+    # Compiled templates are kept here so recycled workers skip recompiling them
+    # (defaults to <instance>/jinja_cache when left empty)
+    JINJA_BYTECODE_CACHE_DIR = os.environ.get('JINJA_BYTECODE_CACHE_DIR')
+    # Completed/cancelled bookings older than this are moved to booking_history
+    ARCHIVE_AFTER_DAYS = 180
+    ARCHIVE_BATCH_SIZE = 500
+    # Admission control for write routes (see admission.py)
+    ADMISSION_ENABLED = True
+    ADMISSION_STORE_PATH = None  # <instance>/admission.db; ':memory:' for a per-process store
+    ADMISSION_USER_RATE = (1.0, 10)  # (tokens per second, burst) per logged-in user
+    ADMISSION_IP_RATE = (2.0, 20)  # (tokens per second, burst) per client IP
+    # Number of reverse proxies in front of the app (1 behind the Heroku router).
+    # When set, X-Forwarded-For is trusted so the per-IP bucket sees the real
+    # client address instead of the proxy's; leave at 0 when serving directly,
+    # or clients could spoof the header to dodge the limit.
+    PROXY_FIX_X_FOR = int(os.environ.get('PROXY_FIX_X_FOR', 0))
+    ADMISSION_WRITE_CONCURRENCY = 4  # Write requests in flight across all workers
+    ADMISSION_PRIORITY_RESERVED = 1  # Slots only admin/payment routes may use
+    ADMISSION_SLOT_TIMEOUT = 30  # Seconds before a slot held by a dead worker is reclaimed
+    ADMISSION_RETRY_AFTER = 1  # Retry-After seconds sent with 503s
+    BULK_TRANSITION_LIMIT = 500  # Max booking ids per /bookings/transition call
@@ -0,0 +1,76 @@
+"""Small-integer coded enums for status and role columns.
+
+Members are ``StrEnum``s, so they still compare equal to (and render as)
+their old string values in Python and templates, while the database
+stores the one-byte ``code``. Codes are persisted: never renumber or
+reuse one, only append.
+"""
+from enum import StrEnum
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class CodedEnum(StrEnum):
+
+    def __new__(cls, value, code):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.code = code
+        return member
+
+    @classmethod
+    def from_code(cls, code):
+        return cls._by_code()[code]
+
+    @classmethod
+    def _by_code(cls):
+        # Built on first use; Enum classes don't allow plain class attributes
+        if '_codes' not in cls.__dict__:
+            type.__setattr__(cls, '_codes', {member.code: member for member in cls})
+        return cls._codes
+
+
+class Role(CodedEnum):
+    ADMIN = 'admin', 1
+    CLIENT = 'client', 2
+    PROVIDER = 'provider', 3
+
+
+class BookingStatus(CodedEnum):
+    PENDING = 'pending', 1
+    CONFIRMED = 'confirmed', 2
+    CANCELLED = 'cancelled', 3
+    COMPLETED = 'completed', 4
+
+
+class PaymentStatus(CodedEnum):
+    PENDING = 'pending', 1
+    PAID = 'paid', 2
+
+
+class EnumCode(TypeDecorator):
+    """Column type storing a CodedEnum member as its SMALLINT code.
+
+    Accepts members or their string values; anything else raises
+    ValueError before it reaches the database.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_class(value).code
+
+    def process_literal_param(self, value, dialect):
+        return str(self.process_bind_param(value, dialect))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_class.from_code(value)
@@ -0,0 +1,9 @@
+from flask_sqlalchemy import SQLAlchemy
+from flask_login import LoginManager
+
+from admission import AdmissionControl
+
+# Extensions are created unbound and attached to the app in create_app()
+db = SQLAlchemy()
+login_manager = LoginManager()
+admission = AdmissionControl()
@@ -0,0 +1,7 @@
+from warmup import warm_up
+
+
+def post_worker_init(worker):
+    # Runs after the worker has loaded the app but before it accepts
+    # connections, so the first real request doesn't pay for compilation
+    warm_up(worker.wsgi)
@@ -0,0 +1,16 @@
+from enums import BookingStatus
+from models import Booking
+
+ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
+
+def allowed_file(filename):
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+
+# Add this function to check provider availability
+def is_provider_available(provider_id):
+    # Get current bookings (you might want to adjust the logic based on your needs)
+    current_bookings = Booking.query.filter_by(
+        provider_id=provider_id,
+        status=BookingStatus.CONFIRMED
+    ).all()
+    return len(current_bookings) < 3  # Example: provider is available if they have less than 3 active bookings
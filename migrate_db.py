@@ -1,13 +1,100 @@
-from app import app, db
+from sqlalchemy.schema import CreateTable
 
-def migrate_database():
+from app import create_app
+from enums import BookingStatus, PaymentStatus, Role
+from extensions import db
+from models import Booking, BookingHistory, User
+
+# Text columns that now store CodedEnum codes
+ENUM_COLUMNS = {
+    User: {'role': Role},
+    # History first: rebuilding booking reads its highest id
+    BookingHistory: {'status': BookingStatus, 'payment_status': PaymentStatus, 'provider_payment_status': PaymentStatus},
+    Booking: {'status': BookingStatus, 'payment_status': PaymentStatus, 'provider_payment_status': PaymentStatus},
+}
+
+def _normalized(column):
+    # 'Provider ' and 'provider' are the same role; match the way the CASE does
+    return f'lower(trim({column}))'
+
+def _unmapped_values(conn, table, enum_columns):
+    """Return {column: [values]} that have no code and would be lost in the copy."""
+    existing = {row[1]: row[2] for row in conn.exec_driver_sql(f'PRAGMA table_info("{table.name}")')}
+    quote = conn.dialect.identifier_preparer.quote
+    unmapped = {}
+    for name, enum_class in enum_columns.items():
+        if name not in existing or existing[name].upper() == 'SMALLINT':
+            continue
+        known = ', '.join(f"'{member.value}'" for member in enum_class)
+        rows = conn.exec_driver_sql(
+            f'SELECT DISTINCT {quote(name)} FROM {quote(table.name)} '
+            f'WHERE {quote(name)} IS NOT NULL AND {_normalized(quote(name))} NOT IN ({known})'
+        ).all()
+        if rows:
+            unmapped[f'{table.name}.{name}'] = [value for (value,) in rows]
+    return unmapped
+
+def _rebuild_with_codes(conn, table, enum_columns):
+    # SQLite can't change a column's type in place, so copy into a new table
+    existing = {row[1]: row[2] for row in conn.exec_driver_sql(f'PRAGMA table_info("{table.name}")')}
+    if not existing:
+        table.create(conn)
+        return
+    (current_ddl,) = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table.name,)
+    ).one()
+    needs_autoincrement = table.dialect_options['sqlite']['autoincrement'] and 'AUTOINCREMENT' not in current_ddl
+    if all(existing[name].upper() == 'SMALLINT' for name in enum_columns) and not needs_autoincrement:
+        return
+
+    quote = conn.dialect.identifier_preparer.quote
+    new_name = f'{table.name}_new'
+    ddl = str(CreateTable(table).compile(conn)).replace(
+        f'CREATE TABLE {quote(table.name)} (', f'CREATE TABLE {quote(new_name)} (', 1
+    )
+    conn.exec_driver_sql(ddl)
+
+    columns, values = [], []
+    for column in table.columns:
+        columns.append(quote(column.name))
+        if column.name not in existing:
+            values.append('NULL')
+        elif column.name in enum_columns:
+            cases = ' '.join(f"WHEN '{member.value}' THEN {member.code}" for member in enum_columns[column.name])
+            values.append(f'CASE {_normalized(quote(column.name))} {cases} END')
+        else:
+            values.append(quote(column.name))
+    conn.exec_driver_sql(
+        f'INSERT INTO {quote(new_name)} ({", ".join(columns)}) '
+        f'SELECT {", ".join(values)} FROM {quote(table.name)}'
+    )
+    conn.exec_driver_sql(f'DROP TABLE {quote(table.name)}')
+    conn.exec_driver_sql(f'ALTER TABLE {quote(new_name)} RENAME TO {quote(table.name)}')
+    for index in table.indexes:
+        index.create(conn)
+
+    if table.name == Booking.__tablename__:
+        # Start new ids above every id already used, archived ones included
+        conn.exec_driver_sql("DELETE FROM sqlite_sequence WHERE name IN ('booking', 'booking_new')")
+        conn.exec_driver_sql(
+            "INSERT INTO sqlite_sequence (name, seq) VALUES ('booking', max("
+            "(SELECT coalesce(max(id), 0) FROM booking), (SELECT coalesce(max(id), 0) FROM booking_history)))"
+        )
+
+def migrate_status_codes(config=None):
+    app = create_app(config)
     with app.app_context():
-        # Add provider payment columns
-        db.engine.execute('ALTER TABLE booking ADD COLUMN provider_payment FLOAT')
-        db.engine.execute('ALTER TABLE booking ADD COLUMN provider_payment_status VARCHAR(20) DEFAULT "pending"')
-        db.engine.execute('ALTER TABLE booking ADD COLUMN platform_fee_percentage FLOAT DEFAULT 20')
-        db.session.commit()
+        with db.engine.begin() as conn:
+            # Check every table before rebuilding any, so nothing is half-migrated
+            unmapped = {}
+            for model, enum_columns in ENUM_COLUMNS.items():
+                unmapped.update(_unmapped_values(conn, model.__table__, enum_columns))
+            if unmapped:
+                details = '; '.join(f'{column}: {values!r}' for column, values in unmapped.items())
+                raise SystemExit(f'Unknown values, fix them and re-run the migration: {details}')
+            for model, enum_columns in ENUM_COLUMNS.items():
+                _rebuild_with_codes(conn, model.__table__, enum_columns)
 
 if __name__ == '__main__':
-    migrate_database()
+    migrate_status_codes()
     print("Database migration completed successfully!")
@@ -0,0 +1,115 @@
+from flask_login import UserMixin
+from datetime import datetime
+
+from enums import BookingStatus, EnumCode, PaymentStatus, Role
+from extensions import db, login_manager
+
+# Database Models
+class User(UserMixin, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    email = db.Column(db.String(100), unique=True)
+    password = db.Column(db.String(100))
+    role = db.Column(EnumCode(Role))
+    # New fields
+    first_name = db.Column(db.String(50))
+    last_name = db.Column(db.String(50))
+    phone = db.Column(db.String(20))
+    address = db.Column(db.String(200))
+    wilaya = db.Column(db.String(50))
+    # Provider specific fields
+    service_category = db.Column(db.String(50))
+    experience = db.Column(db.String(500))
+    certification = db.Column(db.String(500))
+    study_degree = db.Column(db.String(100))
+    profile_pic = db.Column(db.String(200))  # Add this line for profile picture
+    about = db.Column(db.Text)  # Add this line
+    is_available = db.Column(db.Boolean, default=True)  # Add this line
+
+class Event(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(100))
+    date = db.Column(db.String(50))
+    location = db.Column(db.String(100))
+    client_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    # Add relationship to User model
+    client = db.relationship('User', backref='events', lazy=True)
+
+# Update Booking model to match the database schema
+class Booking(db.Model):
+    # Hot table: only live bookings and recently settled ones (see archive.py)
+    __table_args__ = (
+        db.Index('ix_booking_provider', 'provider_id'),
+        db.Index('ix_booking_event', 'event_id'),
+        db.Index('ix_booking_status_created', 'status', 'created_at'),
+        # Archived ids live on in booking_history, so SQLite must never hand them out again
+        {'sqlite_autoincrement': True},
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey('event.id'))
+    provider_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    # Only change these through bookings.transition_bookings()
+    status = db.Column(EnumCode(BookingStatus))
+    payment_status = db.Column(EnumCode(PaymentStatus), default=PaymentStatus.PENDING)
+    payment_amount = db.Column(db.Float, nullable=True)
+    provider_payment = db.Column(db.Float, nullable=True)  # Amount paid to provider
+    provider_payment_status = db.Column(EnumCode(PaymentStatus), default=PaymentStatus.PENDING)
+    platform_fee_percentage = db.Column(db.Float, default=20)  # Platform keeps 20%
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    event = db.relationship('Event', backref='bookings', lazy=True)
+    provider = db.relationship('User', backref='my_bookings', lazy=True)
+
+# Partial indexes: dashboards only look up live bookings by state, and these
+# stay small however many completed/cancelled rows pile up
+db.Index('ix_booking_pending', Booking.provider_id,
+         sqlite_where=Booking.status == BookingStatus.PENDING)
+db.Index('ix_booking_confirmed', Booking.provider_id, Booking.payment_status,
+         sqlite_where=Booking.status == BookingStatus.CONFIRMED)
+
+class BookingHistory(db.Model):
+    # Completed/cancelled bookings moved out of `booking` by the archival job
+    __tablename__ = 'booking_history'
+    __table_args__ = (
+        db.Index('ix_booking_history_provider_payment', 'provider_id', 'payment_status'),
+    )
+    id = db.Column(db.Integer, primary_key=True)  # Same id the booking had in the hot table
+    event_id = db.Column(db.Integer)  # No FK: the event may have been deleted since
+    event_title = db.Column(db.String(100))  # Snapshot taken when archived
+    provider_id = db.Column(db.Integer)
+    status = db.Column(EnumCode(BookingStatus))
+    payment_status = db.Column(EnumCode(PaymentStatus))
+    payment_amount = db.Column(db.Float, nullable=True)
+    provider_payment = db.Column(db.Float, nullable=True)
+    provider_payment_status = db.Column(EnumCode(PaymentStatus))
+    platform_fee_percentage = db.Column(db.Float)
+    created_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class Service(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(100))
+    category = db.Column(db.String(50))
+    description = db.Column(db.Text)
+    provider_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Add relationship to User model
+    provider = db.relationship('User', backref=db.backref('services', lazy=True))
+
+class Portfolio(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    provider_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    image_path = db.Column(db.String(200))
+    description = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    provider = db.relationship('User', backref='portfolio_items')
+    title = db.Column(db.String(100))  # Add this line
+    images = db.relationship('PortfolioImage', backref='portfolio_item', cascade='all, delete-orphan')
+
+class PortfolioImage(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    portfolio_id = db.Column(db.Integer, db.ForeignKey('portfolio.id'))
+    image_path = db.Column(db.String(200))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+@login_manager.user_loader
+def load_user(user_id):
+    return User.query.get(int(user_id))
@@ -0,0 +1,63 @@
+from sqlalchemy import case, func, select, union_all
+
+from archive import ARCHIVED_COLUMNS
+from enums import PaymentStatus
+from extensions import db
+from models import Booking, BookingHistory
+
+
+def all_bookings(**filters):
+    """Hot and archived bookings as one subquery, for reporting only.
+
+    Filters are applied to both tables before the UNION so each side can
+    use its own indexes. Dashboards should keep querying ``Booking``.
+    """
+    branches = []
+    for table in (Booking.__table__, BookingHistory.__table__):
+        query = select(*(table.c[name] for name in ARCHIVED_COLUMNS))
+        for name, value in filters.items():
+            query = query.where(table.c[name] == value)
+        branches.append(query)
+    return union_all(*branches).subquery('all_bookings')
+
+
+def provider_earnings(provider_id=None):
+    """Return {provider_id: {'total', 'paid', 'pending'}} across all booking history."""
+    filters = {'payment_status': PaymentStatus.PAID}
+    if provider_id is not None:
+        filters['provider_id'] = provider_id
+    bookings = all_bookings(**filters)
+    rows = db.session.execute(
+        select(
+            bookings.c.provider_id,
+            func.coalesce(func.sum(
+                bookings.c.payment_amount * (100 - bookings.c.platform_fee_percentage) / 100
+            ), 0),
+            func.coalesce(func.sum(case(
+                (bookings.c.provider_payment_status == PaymentStatus.PAID, bookings.c.provider_payment),
+                else_=0,
+            )), 0),
+        ).group_by(bookings.c.provider_id)
+    )
+    return {
+        pid: {'total': total, 'paid': paid, 'pending': total - paid}
+        for pid, total, paid in rows
+    }
+
+
+def revenue_totals():
+    """Return (total_revenue, platform_revenue) across all booking history."""
+    bookings = all_bookings(payment_status=PaymentStatus.PAID)
+    total, platform = db.session.execute(
+        select(
+            func.coalesce(func.sum(bookings.c.payment_amount), 0),
+            func.coalesce(func.sum(
+                bookings.c.payment_amount * bookings.c.platform_fee_percentage / 100
+            ), 0),
+        )
+    ).one()
+    return total, platform
+
+
+def booking_count():
+    return db.session.scalar(select(func.count()).select_from(all_bookings()))
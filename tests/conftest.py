@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from enums import Role  # noqa: E402
+from extensions import db  # noqa: E402
+from models import User  # noqa: E402
+
+
+def make_app(tmp_path, **config):
+    """App on a fresh database under tmp_path, seeded with one client and one provider."""
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/test.db',
+        'JINJA_BYTECODE_CACHE_DIR': str(tmp_path / 'jinja_cache'),
+        'ADMISSION_STORE_PATH': ':memory:',
+        **config,
+    })
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([
+            User(id=1, email='client@example.com', password='pw', role=Role.CLIENT),
+            User(id=2, email='provider@example.com', password='pw', role=Role.PROVIDER),
+        ])
+        db.session.commit()
+    return app
+
+
+@pytest.fixture
+def app(tmp_path):
+    return make_app(tmp_path)
+
+
+def login(client, email):
+    return client.post('/login', data={'email': email, 'password': 'pw'})
@@ -0,0 +1,115 @@
+import time
+
+import pytest
+
+from conftest import login, make_app
+from enums import BookingStatus
+from extensions import admission, db
+from models import Booking, Event
+
+
+def register(client, n, ip='203.0.113.1'):
+    data = {'email': f'user{n}@example.com', 'password': 'pw'}
+    return client.post('/register/client', data=data, headers={'X-Forwarded-For': ip})
+
+
+def fill_slots(app, count):
+    with app.app_context():
+        for _ in range(count):
+            assert admission.store.acquire_slot(count, 60, time.time()) is not None
+
+
+def test_ip_bucket_uses_forwarded_client_address_behind_proxy(tmp_path):
+    app = make_app(tmp_path, ADMISSION_IP_RATE=(0.001, 1), PROXY_FIX_X_FOR=1)
+    client = app.test_client()
+
+    assert register(client, 1, '203.0.113.1').status_code == 302
+    assert register(client, 2, '203.0.113.2').status_code == 302
+    assert register(client, 3, '203.0.113.1').status_code == 429
+
+
+@pytest.mark.parametrize('store_path', [':memory:', 'admission.db'])
+def test_user_bucket_rejects_without_spending_the_ip_token(tmp_path, store_path):
+    if store_path != ':memory:':
+        store_path = str(tmp_path / store_path)
+    app = make_app(tmp_path, ADMISSION_STORE_PATH=store_path,
+                   ADMISSION_USER_RATE=(0.001, 1), ADMISSION_IP_RATE=(0.001, 2))
+    client = app.test_client()
+    login(client, 'client@example.com')
+
+    response = client.post('/request_booking/2', data={'event_id': 1})
+    assert response.status_code != 429
+    response = client.post('/request_booking/2', data={'event_id': 1})
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) > 0
+
+    # The rejected request left the shared IP its second token
+    client.get('/logout')
+    assert register(client, 1).status_code == 302
+    assert register(client, 2).status_code == 429
+    with app.app_context():
+        metrics = admission.metrics()
+    assert metrics['shed_rate_limited'] == 2
+    assert metrics['in_flight'] == 0
+
+
+def test_full_slots_shed_writes_with_503_and_retry_after(tmp_path):
+    app = make_app(tmp_path, ADMISSION_WRITE_CONCURRENCY=2, ADMISSION_PRIORITY_RESERVED=0,
+                   ADMISSION_RETRY_AFTER=7)
+    fill_slots(app, 2)
+
+    response = register(app.test_client(), 1)
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '7'
+
+
+def test_reserved_slot_still_admits_payment_routes(tmp_path):
+    app = make_app(tmp_path, ADMISSION_WRITE_CONCURRENCY=2, ADMISSION_PRIORITY_RESERVED=1)
+    with app.app_context():
+        db.session.add(Event(id=1, title='Wedding', client_id=1))
+        db.session.add(Booking(id=1, event_id=1, provider_id=2, status=BookingStatus.CONFIRMED))
+        db.session.commit()
+    fill_slots(app, 1)
+
+    provider = app.test_client()
+    login(provider, 'provider@example.com')
+    assert provider.post('/add_portfolio', data={'title': 'Stage'}).status_code == 503
+    response = provider.post('/booking/1/confirm_payment', data={'payment_amount': 1000})
+    assert response.status_code == 302
+
+    admin = app.test_client()
+    admin.post('/admin', data={'username': 'admin', 'password': 'admin'})
+    assert admin.post('/admin/pay_provider/1').status_code == 302
+    with app.app_context():
+        assert db.session.get(Booking, 1).provider_payment == 800
+
+
+def test_admission_metrics_are_admin_only(tmp_path):
+    app = make_app(tmp_path, ADMISSION_WRITE_CONCURRENCY=1, ADMISSION_PRIORITY_RESERVED=0)
+    client = app.test_client()
+    assert register(client, 1).status_code == 302
+    fill_slots(app, 1)
+    assert register(client, 2).status_code == 503
+
+    login(client, 'client@example.com')
+    assert client.get('/admin/admission_metrics').status_code == 302
+
+    admin = app.test_client()
+    admin.post('/admin', data={'username': 'admin', 'password': 'admin'})
+    assert admin.get('/admin/admission_metrics').get_json() == {
+        'admitted': 1, 'shed_rate_limited': 0, 'shed_overloaded': 1, 'in_flight': 1,
+    }
+
+
+def test_locked_store_on_release_does_not_fail_the_request(tmp_path, monkeypatch):
+    import sqlite3
+
+    app = make_app(tmp_path, ADMISSION_STORE_PATH=str(tmp_path / 'admission.db'))
+    with app.app_context():
+        store = admission.store
+
+    def locked(slot):
+        raise sqlite3.OperationalError('database is locked')
+    monkeypatch.setattr(store, 'release_slot', locked)
+
+    assert register(app.test_client(), 1).status_code == 302
@@ -0,0 +1,80 @@
+from conftest import login
+from extensions import db
+from models import Booking, BookingHistory, Event
+
+
+def book_and_cancel(client, title):
+    client.post('/create_event', data={'title': title, 'date': '2026-01-01', 'location': 'Oran'})
+    event_id = db.session.scalar(db.select(Event.id).where(Event.title == title))
+    client.post('/request_booking/2', data={'event_id': event_id})
+    return client.post(f'/event/{event_id}/cancel')
+
+
+def test_cancel_rebook_cancel_does_not_reuse_archived_ids(app):
+    client = app.test_client()
+    login(client, 'client@example.com')
+    with app.app_context():
+        assert book_and_cancel(client, 'First').status_code == 302
+        assert book_and_cancel(client, 'Second').status_code == 302
+        assert Booking.query.count() == 0
+        assert sorted(h.event_title for h in BookingHistory.query) == ['First', 'Second']
+
+
+def test_archive_bookings_moves_old_settled_and_orphaned_only(app):
+    from datetime import datetime, timedelta
+    from archive import archive_bookings
+    from enums import BookingStatus
+
+    old = datetime.utcnow() - timedelta(days=400)
+    with app.app_context():
+        db.session.add(Event(id=1, title='Live', client_id=1))
+        db.session.add_all([
+            Booking(id=1, event_id=1, provider_id=2, status=BookingStatus.COMPLETED, created_at=old),
+            Booking(id=2, event_id=1, provider_id=2, status=BookingStatus.CANCELLED),
+            Booking(id=3, event_id=1, provider_id=2, status=BookingStatus.PENDING, created_at=old),
+            Booking(id=4, event_id=99, provider_id=2, status=BookingStatus.PENDING),
+        ])
+        db.session.commit()
+        assert archive_bookings(older_than_days=180, batch_size=1) == 2
+        assert sorted(b.id for b in Booking.query) == [2, 3]
+        assert sorted(h.id for h in BookingHistory.query) == [1, 4]
+
+
+def test_bookings_awaiting_provider_payout_stay_in_booking(app):
+    from datetime import datetime, timedelta
+    from archive import archive_bookings
+    from enums import BookingStatus, PaymentStatus
+    from reports import provider_earnings
+
+    old = datetime.utcnow() - timedelta(days=400)
+    with app.app_context():
+        db.session.add(Event(id=1, title='Wedding', client_id=1))
+        db.session.add(Booking(id=1, event_id=1, provider_id=2, status=BookingStatus.COMPLETED,
+                               payment_status=PaymentStatus.PAID, payment_amount=1000,
+                               created_at=old))
+        db.session.commit()
+
+        client = app.test_client()
+        login(client, 'client@example.com')
+        client.post('/create_event', data={'title': 'Party', 'date': '2026-01-01', 'location': 'Oran'})
+        event_id = db.session.scalar(db.select(Event.id).where(Event.title == 'Party'))
+        client.post('/request_booking/2', data={'event_id': event_id})
+        booking_id = db.session.scalar(db.select(Booking.id).where(Booking.event_id == event_id))
+        db.session.execute(db.update(Booking).where(Booking.id == booking_id).values(
+            status=BookingStatus.CONFIRMED, payment_status=PaymentStatus.PAID, payment_amount=500))
+        db.session.commit()
+        assert client.post(f'/event/{event_id}/cancel').status_code == 302
+
+        assert archive_bookings(older_than_days=180, batch_size=1) == 0
+        assert sorted(b.id for b in Booking.query) == [1, booking_id]
+        assert BookingHistory.query.count() == 0
+
+        admin = app.test_client()
+        admin.post('/admin', data={'username': 'admin', 'password': 'admin'})
+        assert admin.post('/admin/pay_provider/1').status_code == 302
+        assert admin.post(f'/admin/pay_provider/{booking_id}').status_code == 302
+        db.session.expire_all()
+        assert provider_earnings(2)[2]['pending'] == 0
+
+        assert archive_bookings(older_than_days=180) == 2
+        assert Booking.query.count() == 0
@@ -0,0 +1,81 @@
+import pytest
+
+from conftest import login
+
+
+@pytest.mark.parametrize('ids', [[True], [0], [-1], [2**63], [2**70], ['1'], 1])
+def test_bulk_transition_rejects_invalid_ids(app, ids):
+    client = app.test_client()
+    login(client, 'provider@example.com')
+    response = client.post('/bookings/transition', json={'ids': ids, 'status': 'confirmed'})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize('action', ['accept', 'decline'])
+def test_clients_cannot_use_provider_booking_actions(app, action):
+    from enums import BookingStatus
+    from extensions import db
+    from models import Booking, Event
+
+    with app.app_context():
+        db.session.add(Event(id=1, title='Wedding', client_id=1))
+        db.session.add(Booking(id=1, event_id=1, provider_id=2, status=BookingStatus.CONFIRMED))
+        db.session.commit()
+    client = app.test_client()
+    login(client, 'client@example.com')
+    response = client.post(f'/booking/1/{action}')
+    assert response.headers['Location'] == '/'
+    with app.app_context():
+        assert db.session.get(Booking, 1).status == BookingStatus.CONFIRMED
+
+
+def test_bulk_transition_reports_each_booking_in_a_mixed_batch(app):
+    from enums import BookingStatus, Role
+    from extensions import db
+    from models import Booking, Event, User
+
+    with app.app_context():
+        db.session.add(User(id=3, email='other@example.com', password='pw', role=Role.PROVIDER))
+        db.session.add(Event(id=1, title='Wedding', client_id=1))
+        db.session.add_all([
+            Booking(id=1, event_id=1, provider_id=2, status=BookingStatus.PENDING),
+            Booking(id=2, event_id=1, provider_id=2, status=BookingStatus.CONFIRMED),
+            Booking(id=3, event_id=1, provider_id=3, status=BookingStatus.PENDING),
+        ])
+        db.session.commit()
+    client = app.test_client()
+    login(client, 'provider@example.com')
+    response = client.post('/bookings/transition', json={'ids': [1, 2, 3, 99], 'status': 'confirmed'})
+    assert response.status_code == 200
+    assert response.get_json() == {
+        'updated': 1,
+        'results': {'1': 'ok', '2': 'invalid_transition', '3': 'not_found', '99': 'not_found'},
+    }
+    with app.app_context():
+        statuses = {b.id: b.status for b in Booking.query}
+    assert statuses == {1: BookingStatus.CONFIRMED, 2: BookingStatus.CONFIRMED, 3: BookingStatus.PENDING}
+
+
+def test_mark_event_complete_warns_about_unpaid_bookings(app):
+    from enums import BookingStatus, PaymentStatus
+    from extensions import db
+    from models import Booking, Event
+
+    with app.app_context():
+        db.session.add(Event(id=1, title='Wedding', client_id=1))
+        db.session.add_all([
+            Booking(id=1, event_id=1, provider_id=2, status=BookingStatus.CONFIRMED,
+                    payment_status=PaymentStatus.PAID, payment_amount=1000),
+            Booking(id=2, event_id=1, provider_id=2, status=BookingStatus.CONFIRMED),
+        ])
+        db.session.commit()
+    client = app.test_client()
+    login(client, 'client@example.com')
+    client.post('/event/1/complete')
+    with client.session_transaction() as session:
+        assert session['_flashes'] == [
+            ('warning', '1 confirmed booking(s) not completed: payment has not been confirmed yet'),
+        ]
+    with app.app_context():
+        statuses = {b.id: b.status for b in Booking.query}
+    assert statuses == {1: BookingStatus.COMPLETED, 2: BookingStatus.CONFIRMED}
@@ -0,0 +1,47 @@
+import sqlite3
+
+import pytest
+
+import migrate_db
+from enums import Role
+from extensions import db
+from app import create_app
+from models import User
+
+OLD_SCHEMA = '''
+CREATE TABLE user (id INTEGER PRIMARY KEY, email VARCHAR(100) UNIQUE, password VARCHAR(100), role VARCHAR(20));
+CREATE TABLE event (id INTEGER PRIMARY KEY, title VARCHAR(100), client_id INTEGER);
+CREATE TABLE booking (id INTEGER PRIMARY KEY, event_id INTEGER, provider_id INTEGER, status VARCHAR(20),
+                      payment_status VARCHAR(20), provider_payment_status VARCHAR(20));
+'''
+
+
+def old_database(tmp_path, roles):
+    path = tmp_path / 'old.db'
+    conn = sqlite3.connect(path)
+    conn.executescript(OLD_SCHEMA)
+    conn.executemany('INSERT INTO user (email, role) VALUES (?, ?)',
+                     [(f'user{i}@example.com', role) for i, role in enumerate(roles)])
+    conn.commit()
+    conn.close()
+    return {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}',
+        'JINJA_BYTECODE_CACHE_DIR': str(tmp_path / 'jinja_cache'),
+        'ADMISSION_STORE_PATH': ':memory:',
+    }
+
+
+def test_migration_maps_roles_case_insensitively(tmp_path):
+    config = old_database(tmp_path, ['admin', 'Provider', ' client '])
+    migrate_db.migrate_status_codes(config)
+    with create_app(config).app_context():
+        assert [user.role for user in User.query.order_by(User.id)] == [Role.ADMIN, Role.PROVIDER, Role.CLIENT]
+
+
+def test_migration_refuses_unknown_values(tmp_path):
+    config = old_database(tmp_path, ['admin', 'superuser'])
+    with pytest.raises(SystemExit, match='superuser'):
+        migrate_db.migrate_status_codes(config)
+    with create_app(config).app_context():
+        # Nothing was rebuilt
+        assert db.session.execute(db.text('SELECT role FROM user ORDER BY id')).scalars().all() == ['admin', 'superuser']
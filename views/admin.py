@@ -0,0 +1,118 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, abort
+from flask_login import login_user, login_required, current_user
+
+from bookings import transition_booking
+from enums import PaymentStatus, Role
+from extensions import admission, db
+from models import User, Event, Booking
+import reports
+
+bp = Blueprint('admin', __name__)
+
+@bp.route('/admin', methods=['GET', 'POST'])
+def admin_login():
+    if request.method == 'POST':
+        username = request.form.get('username')
+        password = request.form.get('password')
+        
+        if username == 'admin' and password == 'admin':
+            admin_user = User.query.filter_by(email='admin@ezyevents.com').first()
+            if not admin_user:
+                # Create admin user if it doesn't exist
+                admin_user = User(
+                    email='admin@ezyevents.com',
+                    password='admin',
+                    role=Role.ADMIN,
+                    first_name='Admin',
+                    last_name='User'
+                )
+                db.session.add(admin_user)
+                db.session.commit()
+            
+            login_user(admin_user)
+            return redirect(url_for('admin.admin_dashboard'))
+            
+        flash('Invalid credentials', 'error')
+    return render_template('admin_login.html')
+
+@bp.route('/admin/dashboard')
+@login_required
+def admin_dashboard():
+    if current_user.role != Role.ADMIN:
+        return redirect(url_for('admin.admin_login'))
+    
+    # Revenue and earnings span archived history as well as the hot table
+    total_revenue, platform_revenue = reports.revenue_totals()
+    
+    # Get provider earnings
+    providers = User.query.filter_by(role=Role.PROVIDER).all()
+    earnings = reports.provider_earnings()
+    provider_earnings = {
+        provider.id: earnings.get(provider.id, {'total': 0, 'paid': 0, 'pending': 0})
+        for provider in providers
+    }
+    
+    stats = {
+        'total_users': User.query.count(),
+        'total_events': Event.query.count(),
+        'total_providers': User.query.filter_by(role=Role.PROVIDER).count(),
+        'total_bookings': reports.booking_count(),
+        'total_revenue': total_revenue,
+        'platform_revenue': platform_revenue
+    }
+    
+    # Gather data for each tab
+    users = User.query.all()
+    events = Event.query.all()
+    providers = User.query.filter_by(role=Role.PROVIDER).all()
+    bookings = Booking.query.all()
+    
+    return render_template('admin.html',
+                         stats=stats,
+                         users=users,
+                         events=events,
+                         providers=providers,
+                         bookings=bookings,
+                         provider_earnings=provider_earnings)
+
+@bp.route('/admin/pay_provider/<int:booking_id>', methods=['POST'])
+@login_required
+@admission.limit(priority=True)
+def pay_provider(booking_id):
+    if current_user.role != Role.ADMIN:
+        return redirect(url_for('public.index'))
+    
+    provider_amount = Booking.payment_amount * (100 - Booking.platform_fee_percentage) / 100
+    result = transition_booking(current_user, booking_id, PaymentStatus.PAID,
+                                field='provider_payment_status',
+                                values={'provider_payment': provider_amount})
+    if result == 'not_found':
+        abort(404)
+    if result == 'invalid_transition':
+        flash('Cannot pay provider before client payment is confirmed, or twice', 'error')
+        return redirect(url_for('admin.admin_dashboard'))
+    db.session.commit()
+    provider_amount = db.session.get(Booking, booking_id).provider_payment
+    
+    flash(f'Provider payment of {provider_amount} DZD processed successfully', 'success')
+    return redirect(url_for('admin.admin_dashboard'))
+
+@bp.route('/admin/delete_user/<int:user_id>', methods=['POST'])
+@login_required
+@admission.limit(priority=True)
+def delete_user(user_id):
+    if current_user.role != Role.ADMIN:
+        return redirect(url_for('public.index'))
+    
+    user = User.query.get_or_404(user_id)
+    db.session.delete(user)
+    db.session.commit()
+    flash('User deleted successfully', 'success')
+    return redirect(url_for('admin.admin_dashboard'))
+
+@bp.route('/admin/admission_metrics')
+@login_required
+def admission_metrics():
+    if current_user.role != Role.ADMIN:
+        return redirect(url_for('public.index'))
+    return jsonify(admission.metrics())
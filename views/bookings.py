@@ -0,0 +1,34 @@
+from flask import Blueprint, current_app, request, jsonify
+from flask_login import login_required, current_user
+
+from bookings import allowed_targets, transition_bookings
+from extensions import admission, db
+
+bp = Blueprint('bookings', __name__)
+
+def _is_booking_id(value):
+    # bool is an int subclass, and SQLite ids are signed 64-bit
+    return isinstance(value, int) and not isinstance(value, bool) and 0 < value < 2**63
+
+@bp.route('/bookings/transition', methods=['POST'])
+@login_required
+@admission.limit()
+def bulk_transition():
+    """Move many bookings to one status: {"ids": [...], "status": "confirmed"}."""
+    data = request.get_json(silent=True) or {}
+    ids = data.get('ids')
+    target = data.get('status')
+    
+    if not isinstance(ids, list) or not all(_is_booking_id(i) for i in ids):
+        return jsonify({'error': 'ids must be a list of booking ids'}), 400
+    if len(ids) > current_app.config['BULK_TRANSITION_LIMIT']:
+        return jsonify({'error': 'too many bookings in one request'}), 400
+    if not isinstance(target, str) or target not in allowed_targets(current_user):
+        return jsonify({'error': f'cannot move bookings to {target!r}'}), 400
+    
+    results = transition_bookings(current_user, ids, target)
+    db.session.commit()
+    return jsonify({
+        'updated': sum(1 for result in results.values() if result == 'ok'),
+        'results': {str(booking_id): result for booking_id, result in results.items()}
+    })
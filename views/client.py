@@ -0,0 +1,179 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from flask_login import login_required, current_user
+from sqlalchemy import select
+
+from extensions import admission, db
+from archive import AWAITING_PAYOUT, move_to_history
+from bookings import transition_event_bookings
+from enums import BookingStatus, Role
+from models import User, Event, Booking
+
+bp = Blueprint('client', __name__)
+
+@bp.route('/client')
+@login_required
+def client_dashboard():
+    if current_user.role != Role.CLIENT:
+        return redirect(url_for('public.index'))
+    events = Event.query.filter_by(client_id=current_user.id).all()
+    return render_template('client_dashboard.html', user=current_user, events=events)
+
+@bp.route('/create_event', methods=['POST'])
+@login_required
+def create_event():
+    if current_user.role != Role.CLIENT:
+        return redirect(url_for('public.index'))
+    
+    new_event = Event(
+        title=request.form.get('title'),
+        date=request.form.get('date'),
+        location=request.form.get('location'),
+        client_id=current_user.id
+    )
+    db.session.add(new_event)
+    db.session.commit()
+    flash('Event created successfully!', 'success')
+    return redirect(url_for('client.client_dashboard'))
+
+@bp.route('/providers')
+@login_required
+def browse_providers():
+    if current_user.role != Role.CLIENT:
+        return redirect(url_for('public.index'))
+    providers = User.query.filter_by(role=Role.PROVIDER).all()
+    events = Event.query.filter_by(client_id=current_user.id).all()
+    return render_template('providers.html', providers=providers, events=events)
+
+@bp.route('/request_booking/<int:provider_id>', methods=['POST'])
+@login_required
+@admission.limit()
+def request_booking(provider_id):
+    if current_user.role != Role.CLIENT:
+        return redirect(url_for('public.index'))
+    
+    event_id = request.form.get('event_id')
+    if not event_id:
+        flash('Please select an event first', 'error')
+        return redirect(url_for('client.browse_providers'))
+    
+    # Check if this provider is already booked for this event
+    existing_booking = Booking.query.filter_by(
+        event_id=event_id,
+        provider_id=provider_id
+    ).first()
+    
+    if existing_booking:
+        flash('This provider is already booked for this event', 'warning')
+        return redirect(url_for('client.browse_providers'))
+    
+    new_booking = Booking(
+        event_id=event_id,
+        provider_id=provider_id,
+        status=BookingStatus.PENDING
+    )
+    db.session.add(new_booking)
+    db.session.commit()
+    flash('Booking request sent to provider', 'success')
+    return redirect(url_for('client.my_bookings'))
+
+@bp.route('/my_bookings')
+@login_required
+def my_bookings():
+    if current_user.role != Role.CLIENT:
+        return redirect(url_for('public.index'))
+    # Get all events for the current client
+    events = Event.query.filter_by(client_id=current_user.id).all()
+    return render_template('client_bookings.html', events=events, user=current_user)
+
+@bp.route('/provider/<int:provider_id>/details')
+@login_required
+def provider_details(provider_id):
+    if current_user.role != Role.CLIENT:
+        return redirect(url_for('public.index'))
+    
+    # Check if this client has a confirmed booking with this provider
+    booking = Booking.query.filter_by(
+        provider_id=provider_id,
+        status=BookingStatus.CONFIRMED
+    ).first()
+    
+    if not booking:
+        flash('You can only view contact details for confirmed providers', 'error')
+        return redirect(url_for('client.my_bookings'))
+        
+    provider = User.query.get_or_404(provider_id)
+    return jsonify({
+        'name': f"{provider.first_name} {provider.last_name}",
+        'email': provider.email,
+        'phone': provider.phone,
+        'address': provider.address,
+        'wilaya': provider.wilaya,
+        'category': provider.service_category,
+        'experience': provider.experience,
+        'certification': provider.certification
+    })
+
+@bp.route('/event/<int:event_id>/details')
+@login_required
+def event_details(event_id):
+    if current_user.role != Role.CLIENT:
+        return redirect(url_for('public.index'))
+    
+    event = Event.query.get_or_404(event_id)
+    if event.client_id != current_user.id:
+        return redirect(url_for('client.client_dashboard'))
+        
+    # Get all bookings for this event
+    bookings = Booking.query.filter_by(event_id=event.id).all()
+    
+    return render_template('event_details.html', event=event, bookings=bookings)
+
+@bp.route('/event/<int:event_id>/cancel', methods=['POST'])
+@login_required
+def cancel_event(event_id):
+    if current_user.role != Role.CLIENT:
+        return redirect(url_for('public.index'))
+    
+    event = Event.query.get_or_404(event_id)
+    if event.client_id != current_user.id:
+        return redirect(url_for('client.client_dashboard'))
+    
+    # Cancel all live bookings in one UPDATE
+    transition_event_bookings(current_user, event.id, BookingStatus.CANCELLED)
+    
+    # Move them to history before the event goes, so no booking is left
+    # pointing at a deleted event. Paid bookings still awaiting a provider
+    # payout stay in booking until pay_provider has run.
+    booking_ids = db.session.scalars(
+        select(Booking.id).where(Booking.event_id == event.id, ~AWAITING_PAYOUT)
+    ).all()
+    move_to_history(booking_ids)
+    db.session.delete(event)
+    db.session.commit()
+    flash('Event cancelled successfully', 'success')
+    return redirect(url_for('client.client_dashboard'))
+
+@bp.route('/event/<int:event_id>/complete', methods=['POST'])
+@login_required
+def mark_event_complete(event_id):
+    if current_user.role != Role.CLIENT:
+        return redirect(url_for('public.index'))
+    
+    event = Event.query.get_or_404(event_id)
+    if event.client_id != current_user.id:
+        return redirect(url_for('client.client_dashboard'))
+    
+    confirmed = set(db.session.scalars(
+        select(Booking.id).where(Booking.event_id == event.id, Booking.status == BookingStatus.CONFIRMED)
+    ))
+    # Mark all confirmed bookings as completed; unpaid ones are skipped
+    completed = transition_event_bookings(current_user, event.id, BookingStatus.COMPLETED)
+    db.session.commit()
+    unpaid = len(confirmed - completed)
+    if unpaid:
+        flash(f'{unpaid} confirmed booking(s) not completed: payment has not been confirmed yet', 'warning')
+    elif completed:
+        flash('Event marked as completed', 'success')
+    else:
+        flash('This event has no confirmed bookings to complete', 'error')
+    return redirect(url_for('client.client_dashboard'))
@@ -0,0 +1,256 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, current_app, abort
+from flask_login import login_required, current_user
+from datetime import datetime
+from werkzeug.utils import secure_filename
+import os
+
+from bookings import transition_booking
+from enums import BookingStatus, PaymentStatus, Role
+from extensions import admission, db
+from helpers import allowed_file
+from models import Booking, Service, Portfolio, PortfolioImage
+from reports import provider_earnings
+
+bp = Blueprint('provider', __name__)
+
+@bp.route('/provider')
+@login_required
+def provider_dashboard():
+    if current_user.role != Role.PROVIDER:
+        return redirect(url_for('public.index'))
+    
+    # Calculate earnings (including archived bookings)
+    earnings = provider_earnings(current_user.id).get(current_user.id, {'total': 0, 'paid': 0, 'pending': 0})
+    total_earnings = earnings['total']
+    paid_amount = earnings['paid']
+    pending_amount = earnings['pending']
+    
+    pending_requests = Booking.query.filter_by(
+        provider_id=current_user.id,
+        status=BookingStatus.PENDING
+    ).all()
+    
+    to_pay = Booking.query.filter_by(
+        provider_id=current_user.id,
+        status=BookingStatus.CONFIRMED,
+        payment_status=PaymentStatus.PENDING
+    ).all()
+    
+    scheduled = Booking.query.filter_by(
+        provider_id=current_user.id,
+        status=BookingStatus.CONFIRMED,
+        payment_status=PaymentStatus.PAID
+    ).all()
+    
+    completed = Booking.query.filter_by(
+        provider_id=current_user.id,
+        status=BookingStatus.COMPLETED
+    ).all()
+    
+    return render_template('provider_dashboard.html', 
+                         user=current_user,
+                         pending_requests=pending_requests,
+                         to_pay=to_pay,
+                         scheduled=scheduled,
+                         completed=completed,
+                         total_earnings=total_earnings,
+                         paid_amount=paid_amount,
+                         pending_amount=pending_amount)
+
+@bp.route('/add_service', methods=['POST'])
+@login_required
+def add_service():
+    if current_user.role != Role.PROVIDER:
+        return redirect(url_for('public.index'))
+    
+    new_service = Service(
+        title=request.form.get('title'),
+        category=request.form.get('category'),
+        description=request.form.get('description'),
+        provider_id=current_user.id
+    )
+    db.session.add(new_service)
+    db.session.commit()
+    flash('Service added successfully!', 'success')
+    return redirect(url_for('provider.provider_dashboard'))
+
+@bp.route('/booking/<int:booking_id>/accept', methods=['POST'])
+@login_required
+def accept_booking(booking_id):
+    if current_user.role != Role.PROVIDER:
+        return redirect(url_for('public.index'))
+    
+    result = transition_booking(current_user, booking_id, BookingStatus.CONFIRMED)
+    if result == 'not_found':
+        abort(404)
+    if result == 'invalid_transition':
+        flash('Only pending requests can be accepted', 'error')
+        return redirect(url_for('provider.provider_dashboard'))
+    db.session.commit()
+    flash('Booking accepted', 'success')
+    return redirect(url_for('provider.provider_dashboard'))
+
+@bp.route('/booking/<int:booking_id>/decline', methods=['POST'])
+@login_required
+def decline_booking(booking_id):
+    if current_user.role != Role.PROVIDER:
+        return redirect(url_for('public.index'))
+    
+    result = transition_booking(current_user, booking_id, BookingStatus.CANCELLED)
+    if result == 'not_found':
+        abort(404)
+    if result == 'invalid_transition':
+        flash('Only pending requests can be declined', 'error')
+        return redirect(url_for('provider.provider_dashboard'))
+    db.session.commit()
+    flash('Booking declined', 'info')
+    return redirect(url_for('provider.provider_dashboard'))
+
+@bp.route('/booking/<int:booking_id>/complete', methods=['POST'])
+@login_required
+def complete_booking(booking_id):
+    if current_user.role != Role.PROVIDER:
+        return redirect(url_for('public.index'))
+    
+    result = transition_booking(current_user, booking_id, BookingStatus.COMPLETED)
+    if result == 'not_found':
+        abort(404)
+    if result == 'invalid_transition':
+        flash('Cannot complete event before payment is confirmed', 'error')
+        return redirect(url_for('provider.provider_dashboard'))
+        
+    db.session.commit()
+    flash('Event marked as completed', 'success')
+    return redirect(url_for('provider.provider_dashboard'))
+
+@bp.route('/booking/<int:booking_id>/confirm_payment', methods=['POST'])
+@login_required
+@admission.limit(priority=True)
+def confirm_payment(booking_id):
+    if current_user.role != Role.PROVIDER:
+        return redirect(url_for('public.index'))
+        
+    payment_amount = float(request.form.get('payment_amount', 0))
+    if payment_amount <= 0:
+        flash('Please enter a valid payment amount', 'error')
+        return redirect(url_for('provider.provider_dashboard'))
+        
+    result = transition_booking(current_user, booking_id, PaymentStatus.PAID,
+                                field='payment_status', values={'payment_amount': payment_amount})
+    if result == 'not_found':
+        abort(404)
+    if result == 'invalid_transition':
+        flash('Payment can only be confirmed once, on a confirmed booking', 'error')
+        return redirect(url_for('provider.provider_dashboard'))
+    db.session.commit()
+    flash('Payment confirmed', 'success')
+    return redirect(url_for('provider.provider_dashboard'))
+
+@bp.route('/upload_profile_pic', methods=['POST'])
+@login_required
+def upload_profile_pic():
+    if 'file' not in request.files:
+        flash('No file part', 'error')
+        return redirect(url_for('provider.provider_dashboard'))
+    
+    file = request.files['file']
+    if file.filename == '':
+        flash('No selected file', 'error')
+        return redirect(url_for('provider.provider_dashboard'))
+        
+    if file and allowed_file(file.filename):
+        filename = secure_filename(file.filename)
+        # Create unique filename using user_id
+        ext = filename.rsplit('.', 1)[1].lower()
+        new_filename = f"profile_{current_user.id}.{ext}"
+        
+        if not os.path.exists(current_app.config['UPLOAD_FOLDER']):
+            os.makedirs(current_app.config['UPLOAD_FOLDER'])
+            
+        file.save(os.path.join(current_app.config['UPLOAD_FOLDER'], new_filename))
+        current_user.profile_pic = new_filename
+        db.session.commit()
+        flash('Profile picture updated successfully', 'success')
+    
+    return redirect(url_for('provider.provider_dashboard'))
+
+@bp.route('/add_portfolio', methods=['POST'])
+@login_required
+@admission.limit()
+def add_portfolio():
+    if current_user.role != Role.PROVIDER:
+        return redirect(url_for('public.index'))
+        
+    files = request.files.getlist('images')
+    if not files or not files[0].filename:
+        flash('No image files', 'error')
+        return redirect(url_for('provider.provider_dashboard'))
+    
+    if len(files) > 3:
+        flash('Maximum 3 images allowed per portfolio item', 'error')
+        return redirect(url_for('provider.provider_dashboard'))
+
+    new_portfolio = Portfolio(
+        provider_id=current_user.id,
+        title=request.form.get('title'),
+        description=request.form.get('description', '')
+    )
+    db.session.add(new_portfolio)
+    
+    for file in files:
+        if file and allowed_file(file.filename):
+            filename = secure_filename(file.filename)
+            ext = filename.rsplit('.', 1)[1].lower()
+            new_filename = f"portfolio_{current_user.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(new_portfolio.images)}.{ext}"
+            
+            if not os.path.exists(current_app.config['UPLOAD_FOLDER']):
+                os.makedirs(current_app.config['UPLOAD_FOLDER'])
+                
+            file.save(os.path.join(current_app.config['UPLOAD_FOLDER'], new_filename))
+            
+            portfolio_image = PortfolioImage(
+                portfolio_id=new_portfolio.id,
+                image_path=new_filename
+            )
+            new_portfolio.images.append(portfolio_image)
+    
+    db.session.commit()
+    flash('Portfolio item added successfully', 'success')
+    return redirect(url_for('provider.provider_dashboard'))
+
+@bp.route('/portfolio/<int:item_id>/details')
+@login_required
+def portfolio_details(item_id):
+    portfolio_item = Portfolio.query.get_or_404(item_id)
+    return jsonify({
+        'title': portfolio_item.title,
+        'images': [{'path': img.image_path} for img in portfolio_item.images],
+        'description': portfolio_item.description,
+        'created_at': portfolio_item.created_at.strftime('%Y-%m-%d')
+    })
+
+@bp.route('/update_profile', methods=['POST'])
+@login_required
+def update_profile():
+    if current_user.role != Role.PROVIDER:
+        return redirect(url_for('public.index'))
+        
+    current_user.about = request.form.get('about', '')
+    current_user.experience = request.form.get('experience', '')
+    current_user.phone = request.form.get('phone', '')
+    current_user.address = request.form.get('address', '')
+    
+    db.session.commit()
+    flash('Profile updated successfully', 'success')
+    return redirect(url_for('provider.provider_dashboard'))
+
+@bp.route('/toggle_availability', methods=['POST'])
+@login_required
+def toggle_availability():
+    if current_user.role != Role.PROVIDER:
+        return redirect(url_for('public.index'))
+    
+    current_user.is_available = not current_user.is_available
+    db.session.commit()
+    flash('Availability status updated successfully', 'success')
+    return redirect(url_for('provider.provider_dashboard'))
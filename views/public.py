@@ -0,0 +1,134 @@
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask_login import login_user, login_required, logout_user
+from sqlalchemy.exc import IntegrityError
+
+from enums import Role
+from extensions import admission, db
+from helpers import is_provider_available
+from models import User
+
+bp = Blueprint('public', __name__)
+
+@bp.route('/')
+def index():
+    return render_template('index.html')
+
+@bp.route('/login', methods=['GET', 'POST'])
+def login():
+    if request.method == 'POST':
+        email = request.form.get('email')
+        password = request.form.get('password')
+        user = User.query.filter_by(email=email).first()
+        
+        if user and user.password == password and user.role != Role.ADMIN:
+            login_user(user)
+            if user.role == Role.CLIENT:
+                return redirect(url_for('client.client_dashboard'))
+            elif user.role == Role.PROVIDER:
+                return redirect(url_for('provider.provider_dashboard'))
+                
+        flash('Invalid email or password', 'error')
+    return render_template('login.html')
+
+@bp.route('/register')
+def register():
+    return render_template('register.html')
+
+@bp.route('/register/client', methods=['GET', 'POST'])
+@admission.limit()
+def register_client():
+    if request.method == 'POST':
+        email = request.form.get('email')
+        # Check if email already exists in the database
+        existing_user = User.query.filter_by(email=email).first()
+        if existing_user:
+            flash('Email already exists. Please use a different email or log in.', 'danger')
+            return redirect(url_for('public.register_client'))
+
+        # Create a new user if the email doesn't exist
+        new_user = User(
+            email=email,
+            password=request.form.get('password'),
+            role=Role.CLIENT,
+            first_name=request.form.get('first_name'),
+            last_name=request.form.get('last_name'),
+            phone=request.form.get('phone'),
+            address=request.form.get('address'),
+            wilaya=request.form.get('wilaya')
+        )
+        db.session.add(new_user)
+        db.session.commit()
+        flash('Registration successful! Please login.', 'success')
+        return redirect(url_for('public.login'))
+    
+    return render_template('register_client.html')
+
+@bp.route('/register/provider', methods=['GET', 'POST'])
+@admission.limit()
+def register_provider():
+    if request.method == 'POST':
+        email = request.form.get('email')
+        
+        # Check if the email already exists in the database
+        existing_user = User.query.filter_by(email=email).first()
+        if existing_user:
+            flash('Email already exists. Please use a different email.', 'danger')
+            return redirect(url_for('public.register_provider'))
+        
+        # Create a new user object
+        new_user = User(
+            email=email,
+            password=request.form.get('password'),
+            role=Role.PROVIDER,
+            first_name=request.form.get('first_name'),
+            last_name=request.form.get('last_name'),
+            phone=request.form.get('phone'),
+            address=request.form.get('address'),
+            wilaya=request.form.get('wilaya'),
+            service_category=request.form.get('service_category'),
+            experience=request.form.get('experience'),
+            certification=request.form.get('certification'),
+            study_degree=request.form.get('study_degree')
+        )
+        
+        try:
+            # Add and commit the new user to the database
+            db.session.add(new_user)
+            db.session.commit()
+            flash('Registration successful! Please login.', 'success')
+            return redirect(url_for('public.login'))
+        except IntegrityError:
+            db.session.rollback()
+            flash('An error occurred during registration. Please try again.', 'danger')
+    
+    # Render the registration template for GET requests or on errors
+    return render_template('register_provider.html')
+
+@bp.route('/logout')
+@login_required
+def logout():
+    logout_user()
+    return redirect(url_for('public.index'))
+
+@bp.route('/provider/<int:provider_id>/profile')
+def provider_profile(provider_id):
+    provider = User.query.filter_by(id=provider_id, role=Role.PROVIDER).first_or_404()
+    is_available = is_provider_available(provider_id)
+    
+    return render_template('provider_profile.html', 
+                         provider=provider,
+                         is_available=is_available)
+
+@bp.route('/providers/search')
+def search_providers():
+    category = request.args.get('category')
+    wilaya = request.args.get('wilaya')
+    query = User.query.filter_by(role=Role.PROVIDER)
+    
+    if category:
+        query = query.filter_by(service_category=category)
+    if wilaya:
+        query = query.filter_by(wilaya=wilaya)
+        
+    providers = query.all()
+    return render_template('providers.html', providers=providers)
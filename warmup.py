@@ -0,0 +1,35 @@
+import os
+
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
+
+from extensions import db
+
+
+def install_bytecode_cache(app):
+    """Attach a persistent Jinja bytecode cache to the app.
+
+    Must run before ``app.jinja_env`` is first accessed, since the
+    environment is created once and then reused.
+    """
+    cache_dir = app.config.get('JINJA_BYTECODE_CACHE_DIR') or os.path.join(app.instance_path, 'jinja_cache')
+    os.makedirs(cache_dir, exist_ok=True)
+    app.jinja_options = {**app.jinja_options, 'bytecode_cache': FileSystemBytecodeCache(cache_dir)}
+
+
+def warm_up(app):
+    """Compile every template and prime SQLAlchemy before serving traffic.
+
+    Runs in every worker at once, so it must not change the schema; that is
+    migrate_db.py's job.
+    """
+    with app.app_context():
+        env = app.jinja_env
+        for name in env.list_templates(extensions=['html']):
+            env.get_template(name)
+        # Resolve relationships/backrefs now instead of on the first query
+        configure_mappers()
+        # Open the first pooled connection
+        db.session.execute(text('SELECT 1'))
+        db.session.remove()